@@ -0,0 +1,264 @@
+"""Loading of the ID3 tags used for validation by id3validator."""
+
+
+from functools import lru_cache
+from os import stat
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import mutagen
+from mutagen.id3 import ID3, ID3TimeStamp, TCON, Frames, Frames_2_2
+
+# tags read from each file for validation
+VALIDATED_TAGS = ("title", "artist", "album", "date", "genre")
+
+# tags loaded from files without an ID3 tag, shared so they can be told apart from files
+# with an ID3 tag but none of the validated tags
+NO_TAGS: Dict[str, List[str]] = {}
+
+TAG_CACHE_SIZE = 4096
+
+# ID3v2 frames read directly for validation, and the tags they are loaded as
+ID3_FRAME_TAGS = {
+    b"TIT2": "title",
+    b"TPE1": "artist",
+    b"TALB": "album",
+    b"TDRC": "date",
+    b"TCON": "genre",
+}
+
+# ID3v2.3 frames mutagen combines into a date, which are left to it to load
+ID3_LEGACY_DATE_FRAMES = (b"TYER", b"TDAT", b"TIME")
+
+# text encodings for ID3v2 text frames, and the null terminator used by each
+ID3_TEXT_ENCODINGS = (
+    ("latin-1", b"\x00"),
+    ("utf-16", b"\x00\x00"),
+    ("utf-16-be", b"\x00\x00"),
+    ("utf-8", b"\x00"),
+)
+
+ID3_FRAME_ID_CHARS = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+
+# ID3_FRAME_TAGS keyed on frame ID strings, as used by mutagen
+ID3_FRAME_NAME_TAGS = {
+    frame_id.decode(): tag for frame_id, tag in ID3_FRAME_TAGS.items()
+}
+
+# frames mutagen should parse when loading tags itself, including ID3v2.2 equivalents
+ID3_KNOWN_FRAMES = {
+    **{
+        frame_id: Frames[frame_id]
+        for frame_id in (
+            *ID3_FRAME_NAME_TAGS,
+            *(frame_id.decode() for frame_id in ID3_LEGACY_DATE_FRAMES),
+        )
+    },
+    **{
+        frame_id: Frames_2_2[frame_id]
+        for frame_id in ("TT2", "TP1", "TAL", "TCO", "TYE", "TDA", "TIM")
+    },
+}
+
+
+def _decode_syncsafe(data: bytes) -> Optional[int]:
+    """Decodes an ID3v2 syncsafe integer, or returns None if it is not valid."""
+    value = 0
+    for byte in data:
+        if byte & 0x80:
+            return None
+        value = (value << 7) | byte
+    return value
+
+
+def _decode_text_frame(body: bytes) -> List[str]:
+    """Decodes the values of an ID3v2 text frame.
+
+    Raises ValueError if the frame's text is not valid in its declared encoding.
+    """
+    if not body or body[0] >= len(ID3_TEXT_ENCODINGS):
+        raise ValueError("Unknown text encoding")
+    codec, terminator = ID3_TEXT_ENCODINGS[body[0]]
+    data = body[1:]
+
+    values = []
+    while data:
+        index = data.find(terminator)
+        # two byte terminators only count when aligned to a code unit
+        while index > 0 and index % len(terminator):
+            index = data.find(terminator, index + 1)
+        if index == -1:
+            values.append(data.decode(codec))
+            break
+        values.append(data[:index].decode(codec))
+        data = data[index + len(terminator) :]
+    return values
+
+
+def _skip_extended_header(data: bytes, version: int) -> Optional[int]:
+    """Returns the offset of the first frame after an ID3v2 extended header, or None if the
+    header is not valid."""
+    if version == 4:
+        offset = _decode_syncsafe(data[:4])
+    else:
+        offset = int.from_bytes(data[:4], "big") + 4
+    if offset is None or offset > len(data):
+        return None
+    return offset
+
+
+def _find_id3_frames(
+    data: bytes, version: int, extended_header: bool
+) -> Optional[Dict[bytes, bytes]]:
+    """Finds the frames read for validation in ID3v2 tag data, returning their bodies.
+
+    Returns None if the tag data cannot be handled without mutagen.
+    """
+    offset = _skip_extended_header(data, version) if extended_header else 0
+    if offset is None:
+        return None
+
+    frames = {}
+    while offset + 10 <= len(data) and data[offset] != 0:
+        frame_id = data[offset : offset + 4]
+        if not ID3_FRAME_ID_CHARS.issuperset(frame_id):
+            return None
+        if version == 4:
+            frame_size = _decode_syncsafe(data[offset + 4 : offset + 8])
+        else:
+            frame_size = int.from_bytes(data[offset + 4 : offset + 8], "big")
+        if frame_size is None or offset + 10 + frame_size > len(data):
+            return None
+        if frame_size and (
+            frame_id in ID3_FRAME_TAGS or frame_id in ID3_LEGACY_DATE_FRAMES
+        ):
+            # compressed or encrypted frames, and repeated frames mutagen would merge, are
+            # not handled
+            if data[offset + 9] or frame_id in frames:
+                return None
+            frames[frame_id] = data[offset + 10 : offset + 10 + frame_size]
+        offset += 10 + frame_size
+
+    if b"TDRC" not in frames and any(i in frames for i in ID3_LEGACY_DATE_FRAMES):
+        return None
+    return frames
+
+
+def _decode_id3_frames(frames: Dict[bytes, bytes]) -> Optional[Dict[str, List[str]]]:
+    """Decodes the frames found by _find_id3_frames() into tags, or returns None if any
+    frame cannot be decoded."""
+    tags = {}
+    try:
+        for frame_id, body in frames.items():
+            if frame_id in ID3_FRAME_TAGS:
+                values = _decode_text_frame(body)
+                if values:
+                    tags[ID3_FRAME_TAGS[frame_id]] = values
+    except ValueError:
+        return None
+    return tags
+
+
+def _has_id3v1_tag(file_obj: BinaryIO) -> bool:
+    """Whether an open file ends with an ID3v1 tag."""
+    file_obj.seek(0, 2)
+    if file_obj.tell() < 128:
+        return False
+    file_obj.seek(-128, 2)
+    return file_obj.read(3) == b"TAG"
+
+
+def _normalise_id3_tags(tags: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Normalises decoded dates and genres in the same way as mutagen."""
+    if "date" in tags:
+        tags["date"] = [ID3TimeStamp(i).text for i in tags["date"]]
+    if "genre" in tags:
+        tags["genre"] = TCON(encoding=3, text=tags["genre"]).genres
+    return tags
+
+
+def _read_id3_subset(file_obj: BinaryIO) -> Optional[Dict[str, List[str]]]:
+    """Reads the tags used for validation directly from an open file's ID3v2 tag.
+
+    Only the frames in ID3_FRAME_TAGS are decoded, skipping the overhead of loading every
+    frame through mutagen. Returns None if the file does not start with an ID3v2.3 or
+    ID3v2.4 tag, or uses any feature this reader does not handle, in which case it should
+    be loaded with mutagen instead.
+    """
+    header = file_obj.read(10)
+    if len(header) < 10 or header[:3] != b"ID3" or header[3] not in (3, 4):
+        return None
+    version = header[3]
+    flags = header[5]
+    size = _decode_syncsafe(header[6:10])
+    if flags & 0x80 or size is None:  # unsynchronised tags are not handled
+        return None
+    data = file_obj.read(size)
+    if len(data) < size:
+        return None
+
+    frames = _find_id3_frames(data, version, bool(flags & 0x40))
+    if frames is None:
+        return None
+
+    tags = _decode_id3_frames(frames)
+    # mutagen also merges in missing tags from an ID3v1 tag at the end of the file
+    if tags is None or (len(tags) < len(VALIDATED_TAGS) and _has_id3v1_tag(file_obj)):
+        return None
+    return _normalise_id3_tags(tags)
+
+
+def _load_id3_subset(file_obj: BinaryIO) -> Dict[str, List[str]]:
+    """Loads the tags used for validation from an open file with mutagen, parsing only the
+    frames needed.
+
+    Used for files _read_id3_subset() does not handle. Raises ID3NoHeaderError if the file
+    has no ID3 tag.
+    """
+    metadata = ID3(file_obj, known_frames=ID3_KNOWN_FRAMES)
+    tags = {}
+    for frame_id, tag in ID3_FRAME_NAME_TAGS.items():
+        id3_frame = metadata.get(frame_id)
+        if id3_frame is None or not id3_frame.text:
+            continue
+        if tag == "date":
+            tags[tag] = [timestamp.text for timestamp in id3_frame.text]
+        elif tag == "genre":
+            tags[tag] = id3_frame.genres
+        else:
+            tags[tag] = list(id3_frame.text)
+    return tags
+
+
+@lru_cache(maxsize=TAG_CACHE_SIZE)
+def _load_tags(
+    filename: str, mtime: int, size: int  # pylint: disable=unused-argument
+) -> Dict[str, List[str]]:
+    """Loads the tags used for validation from an audio file.
+
+    Results are cached using the file's modification time and size as part of the key, so
+    unchanged files are not parsed again when reloaded. Files without an ID3 tag load as
+    NO_TAGS, rather than raising, so that result is cached too. The returned dictionary is
+    shared between calls, and must not be modified.
+    """
+    # open the file once, and share it with mutagen if the tag can't be read directly
+    with open(filename, "rb") as file_obj:
+        tags = _read_id3_subset(file_obj)
+        if tags is None:
+            file_obj.seek(0)
+            try:
+                tags = _load_id3_subset(file_obj)
+            except mutagen.id3.ID3NoHeaderError:
+                tags = NO_TAGS
+    return tags
+
+
+def _file_key(filename: str) -> Tuple[str, int, int]:
+    """Returns a key identifying the current contents of a file, for use in caches."""
+    file_stat = stat(filename)
+    return filename, file_stat.st_mtime_ns, file_stat.st_size
+
+
+def load_file_tags(filename: str) -> Dict[str, List[str]]:
+    """Loads the tags used for validation from an audio file, using the cache if the file
+    is unchanged since it was last loaded."""
+    return _load_tags(*_file_key(filename))
@@ -1,69 +1,103 @@
 """Audio file metadata validator for Trent Radio's Libretime implementation."""
 
 
-from dataclasses import dataclass
-from enum import Enum
-from typing import List, Tuple
-from os import path, walk
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain
+from threading import Thread
+from typing import (
+    Callable,
+    Dict,
+    Final,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from os import cpu_count, path, scandir
 
 import mutagen
 import wx
 import ObjectListView
-from mutagen.easyid3 import EasyID3
-
 
-class ValidationMessages(Enum):
-    """Enumerator to hold validation messages."""
-
-    NO_METADATA = "No metadata found"
-    MISSING_TITLE = "Missing title"
-    MISSING_ARTIST = "Missing artist"
-    MISSING_ALBUM = "Missing album"
-    MISSING_YEAR = "Missing year"
-    MISSING_CATEGORY = "Missing category"
-    INVALID_CATEGORY = "Invalid category"
-    INVALID_GENRE = "Invalid item in genre"
-    CATEGORY_WRONG_POSITION = "Category in wrong position"
+from id3tags import NO_TAGS, load_file_tags
 
+# validation messages
+NO_METADATA: Final = sys.intern("No metadata found")
+MISSING_TITLE: Final = sys.intern("Missing title")
+MISSING_ARTIST: Final = sys.intern("Missing artist")
+MISSING_ALBUM: Final = sys.intern("Missing album")
+MISSING_YEAR: Final = sys.intern("Missing year")
+MISSING_CATEGORY: Final = sys.intern("Missing category")
+INVALID_CATEGORY: Final = sys.intern("Invalid category")
+INVALID_GENRE: Final = sys.intern("Invalid item in genre")
+CATEGORY_WRONG_POSITION: Final = sys.intern("Category in wrong position")
+READ_ERROR: Final = sys.intern("Unable to read file")
 
 DELAY = 100
 
-ALL_CATEGORIES = (
-    11,
-    12,
-    21,
-    22,
-    23,
-    24,
-    31,
-    32,
-    33,
-    34,
-    35,
-    36,
-    41,
-    42,
-    43,
-    44,
-    45,
-    51,
-    52,
-    53,
+# files per task sent to each process when batch validating
+BATCH_CHUNK_SIZE = 32
+
+# track loading is I/O bound, so use more threads than cores
+MAX_WORKERS = min(32, (cpu_count() or 1) * 4)
+
+ALL_CATEGORIES = frozenset(
+    {
+        11,
+        12,
+        21,
+        22,
+        23,
+        24,
+        31,
+        32,
+        33,
+        34,
+        35,
+        36,
+        41,
+        42,
+        43,
+        44,
+        45,
+        51,
+        52,
+        53,
+    }
 )
 
 # validate seasons somehow?
 
-ALL_GENRE_ITEMS = ("CAN", "LOC", "IDG", "HIT", "INS", "NGT")
+ALL_GENRE_ITEMS = frozenset({"CAN", "LOC", "IDG", "HIT", "INS", "NGT"})
+
+# separators between items in the genre tag, along with any surrounding whitespace
+GENRE_SEPARATOR = re.compile(r"\s*[,;/]+\s*")
 
 # read wmas?
 
 ALLOWED_EXTENSIONS = ("mp3", "ogg", "m4a", "wma")
+ALLOWED_SUFFIXES = tuple(f".{extension}" for extension in ALLOWED_EXTENSIONS)
 
+# values used in place of a missing tag
+EMPTY_TAG = ("",)
 
-@dataclass
+# validation results, keyed on file name and track type, with the loaded tags validated
+VALIDATION_CACHE: Dict[tuple, tuple] = {}
+VALIDATION_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
 class TrackType:
     """Class to hold data for a track type, including validation rules
 
+    Track types are immutable and hashable, so can be used in sets or as dictionary keys.
+
     Attributes
     ----------
     name:
@@ -78,14 +112,25 @@ class TrackType:
         Whether the artist field is mandatory for this track type, defaults to False
     album_mandatory: optional
         Whether the album field is mandatory for this track type, defaults to False
+    valid_categories_mask:
+        Bitmask of valid_categories, with bit n set if category n is valid. Read-only, set
+        from valid_categories
     """
 
     name: str
-    valid_categories: Tuple[int] = ALL_CATEGORIES
-    valid_genre_items: Tuple[str] = ALL_GENRE_ITEMS
+    valid_categories: FrozenSet[int] = ALL_CATEGORIES
+    valid_genre_items: FrozenSet[str] = ALL_GENRE_ITEMS
     title_mandatory: bool = False
     artist_mandatory: bool = False
     album_mandatory: bool = False
+    valid_categories_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        mask = 0
+        for category in self.valid_categories:
+            mask |= 1 << category
+        # frozen dataclasses can only set derived fields through object.__setattr__
+        object.__setattr__(self, "valid_categories_mask", mask)
 
     def __str__(self):
         return self.name
@@ -97,17 +142,19 @@ TRACK_TYPES = (
     # DEFAULT_TYPE,
     TrackType(
         "Music",
-        (
-            21,
-            22,
-            23,
-            24,
-            31,
-            32,
-            33,
-            34,
-            35,
-            36,
+        frozenset(
+            {
+                21,
+                22,
+                23,
+                24,
+                31,
+                32,
+                33,
+                34,
+                35,
+                36,
+            }
         ),
         ALL_GENRE_ITEMS,
         True,
@@ -116,35 +163,41 @@ TRACK_TYPES = (
     ),
     TrackType(
         "Community PSA",
-        (
-            11,
-            12,
+        frozenset(
+            {
+                11,
+                12,
+            }
         ),
-        (),
+        frozenset(),
         False,
         False,
         False,
     ),
     TrackType(
         "Trent Radio PSA",
-        (
-            11,
-            12,
+        frozenset(
+            {
+                11,
+                12,
+            }
         ),
-        (),
+        frozenset(),
         False,
         False,
         False,
     ),
-    TrackType("Station ID", (43,), (), False, False, False),
+    TrackType("Station ID", frozenset({43}), frozenset(), False, False, False),
     TrackType(
         "Traffic / Sponsorship",
-        (
-            51,
-            52,
-            53,
+        frozenset(
+            {
+                51,
+                52,
+                53,
+            }
         ),
-        (),
+        frozenset(),
         False,
         False,
         False,
@@ -159,64 +212,67 @@ TRACK_TYPES = (
     ),
     TrackType(
         "Current Programme",
-        (
-            11,
-            12,
-            21,
-            22,
-            23,
-            24,
-            31,
-            32,
-            33,
-            34,
-            35,
-            36,
+        frozenset(
+            {
+                11,
+                12,
+                21,
+                22,
+                23,
+                24,
+                31,
+                32,
+                33,
+                34,
+                35,
+                36,
+            }
         ),
-        ("CAN", "LOC", "IDG", "NGT"),
+        frozenset({"CAN", "LOC", "IDG", "NGT"}),
         True,
         True,
         True,
     ),
     TrackType(
         "Archive Programme",
-        (
-            11,
-            12,
-            21,
-            22,
-            23,
-            24,
-            31,
-            32,
-            33,
-            34,
-            35,
-            36,
+        frozenset(
+            {
+                11,
+                12,
+                21,
+                22,
+                23,
+                24,
+                31,
+                32,
+                33,
+                34,
+                35,
+                36,
+            }
         ),
-        ("CAN", "LOC", "IDG", "NGT"),
+        frozenset({"CAN", "LOC", "IDG", "NGT"}),
         True,
         True,
         True,
     ),
     TrackType(
         "News",
-        (
-            11,
-            12,
+        frozenset(
+            {
+                11,
+                12,
+            }
         ),
-        (),
+        frozenset(),
         False,
         False,
         False,
     ),
     TrackType(
         "Programme Promo",
-        (
-            45,
-            45,
-        ),
-        (),
+        frozenset({45}),
+        frozenset(),
         False,
         False,
         False,
@@ -224,7 +280,7 @@ TRACK_TYPES = (
     TrackType(
         "Continuity",
         ALL_CATEGORIES,
-        (),
+        frozenset(),
         False,
         False,
         False,
@@ -232,8 +288,131 @@ TRACK_TYPES = (
 )
 
 
-class Track:
-    """An individual audio track to be validated"""
+def _split_genres(values: List[str]) -> List[str]:
+    """Splits the values of a genre tag into individual items."""
+    return list(filter(None, chain.from_iterable(map(GENRE_SEPARATOR.split, values))))
+
+
+def _is_category(item: str) -> bool:
+    """Whether a genre item is a category - a "cat" prefix followed by a number."""
+    return item.startswith("cat") and item[3:].isdecimal()
+
+
+def _scan_genres(
+    genres: List[str], valid_genre_items: FrozenSet[str]
+) -> Tuple[Optional[int], int, List[str]]:
+    """Finds the category in a list of genre items, and any other items that are invalid,
+    in a single pass.
+
+    The first category item is taken as the category, and any others are checked as ordinary
+    genre items. Only positions and items are returned, leaving validation messages to the
+    caller.
+
+    Returns
+    -------
+    Tuple[Optional[int], int, List[str]]
+        Index of the category item or None if not found, the category number or 0 if not
+        found, and the invalid items
+    """
+    category_index = None
+    category = 0
+    invalid_items = []
+    for i, item in enumerate(genres):
+        if category_index is None and _is_category(item):
+            category_index = i
+            category = int(item[3:])
+        elif item not in valid_genre_items:
+            invalid_items.append(item)
+    return category_index, category, invalid_items
+
+
+def _cached_validation(key: tuple, metadata: Dict[str, List[str]]) -> Optional[tuple]:
+    """Returns the cached errors, warnings and validation result for a file name and track
+    type, or None if they were not cached for the file's currently loaded tags."""
+    cached = VALIDATION_CACHE.get(key)
+    # loaded tags are cached on the file's mtime and size, so the same tags mean the same file
+    if cached is None or cached[0] is not metadata:
+        return None
+    return cached[1]
+
+
+def _cache_validation(
+    key: tuple, metadata: Dict[str, List[str]], result: tuple
+) -> None:
+    """Stores the errors, warnings and validation result for a file name and track type."""
+    # drop all cached results once full, rather than tracking which are oldest
+    if len(VALIDATION_CACHE) >= VALIDATION_CACHE_SIZE:
+        VALIDATION_CACHE.clear()
+    VALIDATION_CACHE[key] = (metadata, result)
+
+
+def _iter_files(directory: str) -> Iterator[str]:
+    """Yields the paths of all files in a directory and its subdirectories.
+
+    Symbolic links to directories are not followed, and directories that cannot be read
+    are skipped. Subdirectories are kept on an explicit stack rather than walked
+    recursively, so deep trees don't nest generators.
+    """
+    directories = [directory]
+    while directories:
+        try:
+            with scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _read_error(error: Exception) -> str:
+    """Returns the message for a file that could not be read."""
+    # mutagen's ID3 errors are often raised without a message
+    return f"{READ_ERROR}: {str(error) or repr(error)}"
+
+
+def _iter_dropped(filenames: List[str]) -> Iterator[str]:
+    """Yields the paths of dropped files, and of all files within dropped directories."""
+    for filename in filenames:
+        if path.isfile(filename):
+            yield filename
+        elif path.isdir(filename):
+            yield from _iter_files(filename)
+
+
+# tag values are plain attributes, as ObjectListView reads them for every cell on redraw
+class Track:  # pylint: disable=too-many-instance-attributes
+    """An individual audio track to be validated
+
+    Metadata is loaded and validated when the track is created, and again whenever it is
+    refreshed.
+
+    Attributes
+    ----------
+    title:
+        String representation of the title tag, if present
+    artist:
+        String representation of the artist tag, if present
+    album:
+        String representation of the album tag, if present
+    date:
+        String representation of the date tag, if present
+    """
+
+    __slots__ = (
+        "filename",
+        "type",
+        "metadata",
+        "title",
+        "artist",
+        "album",
+        "date",
+        "__valid",
+        "__validated_type",
+        "__errors",
+        "__warnings",
+    )
 
     def __init__(self, filename: str, tracktype: TrackType = DEFAULT_TYPE) -> None:
         """
@@ -247,7 +426,7 @@ class Track:
         self.filename = filename
         self.type = tracktype
         self.__valid = False
-        self.__validated = False
+        self.__validated_type = None
         self.__errors = []
         self.__warnings = []
         self.refresh()
@@ -257,210 +436,324 @@ class Track:
             return self.filename == other.filename
         return False
 
+    def __hash__(self):
+        return hash(self.filename)
+
+    def __validate_tags(self) -> bool:
+        track_type = self.type
+        metadata = self.metadata
+        err_append = self.__errors.append
+        warn_append = self.__warnings.append
+        tags_valid = True
+
+        if "title" not in metadata:
+            if track_type.title_mandatory:
+                err_append(MISSING_TITLE)
+                tags_valid = False
+            else:
+                warn_append(MISSING_TITLE)
+
+        if "album" not in metadata:
+            if track_type.album_mandatory:
+                err_append(MISSING_ALBUM)
+                tags_valid = False
+            else:
+                warn_append(MISSING_ALBUM)
+
+        if "artist" not in metadata:
+            if track_type.artist_mandatory:
+                err_append(MISSING_ARTIST)
+                tags_valid = False
+            else:
+                warn_append(MISSING_ARTIST)
+
+        if "date" not in metadata:
+            warn_append(MISSING_YEAR)
+
+        return tags_valid
+
     def __validate_genre(self) -> bool:
+        track_type = self.type
+        metadata = self.metadata
+        errors = self.__errors
+        err_append = errors.append
+        warn_append = self.__warnings.append
         genre_valid = True
-        if "genre" in self.metadata:
-            genres = []
-            for i in self.metadata["genre"]:
-                j = i.split(", ")
-                genres.extend(j)
-
-            # verify cat is present
-            contains_category = False
-            category_index = None
-            category = 0
-            for i, item in enumerate(genres):
-                if item[0:3] == "cat":
-                    contains_category = True
-                    category_index = i
-                    category = int(item[3:])
-                    break
-
-            if not contains_category:
-                self.__errors.append(ValidationMessages.MISSING_CATEGORY.value)
-                genre_valid = False
+        if "genre" in metadata:
+            genres = _split_genres(metadata["genre"])
+
+            category_index, category, invalid_items = _scan_genres(
+                genres, track_type.valid_genre_items
+            )
 
-            if contains_category:
+            if category_index is None:
+                err_append(MISSING_CATEGORY)
+                genre_valid = False
+            else:
                 # verify cat is in first position
                 if category_index != 0:
-                    self.__warnings.append(
-                        ValidationMessages.CATEGORY_WRONG_POSITION.value
-                    )
+                    warn_append(CATEGORY_WRONG_POSITION)
 
                 # verify cat is valid
-                if category not in self.type.valid_categories:
-                    self.__errors.append(ValidationMessages.INVALID_CATEGORY.value)
-
-            # verify other genre items are acceptable
-            for i, item in enumerate(genres):
-                if i is not category_index:
-                    if item.strip(',') not in self.type.valid_genre_items:
-                        self.__errors.append(
-                            f"{ValidationMessages.INVALID_GENRE.value}: {item}"
-                        )
-                        genre_valid = False
+                if not (track_type.valid_categories_mask >> category) & 1:
+                    err_append(INVALID_CATEGORY)
+
+            if invalid_items:
+                # stored with the item, and only formatted when errors are read
+                errors.extend((INVALID_GENRE, item) for item in invalid_items)
+                genre_valid = False
 
         else:
-            self.__errors.append(ValidationMessages.MISSING_CATEGORY.value)
+            err_append(MISSING_CATEGORY)
             genre_valid = False
 
         return genre_valid
 
     def refresh(self) -> None:
-        """Clears any existing validation, and reloads metadata from file."""
-        self.__valid = False
-        self.__validated = False
-        self.__errors = []
-        self.__warnings = []
+        """Clears any existing validation, reloads metadata from file, and revalidates."""
+        self.__validated_type = None
+        self.metadata = metadata = load_file_tags(self.filename)
 
-        with open(self.filename, "rb") as file_obj:
-            try:
-                self.metadata = EasyID3(file_obj)
-            except mutagen.id3.ID3NoHeaderError:
-                self.__errors.append(ValidationMessages.NO_METADATA.value)
-                self.__valid = False
-                self.__validated = True
+        # loaded tags never have empty value lists, so take the first value, if present
+        self.title = metadata.get("title", EMPTY_TAG)[0]
+        self.artist = metadata.get("artist", EMPTY_TAG)[0]
+        self.album = metadata.get("album", EMPTY_TAG)[0]
+        self.date = metadata.get("date", EMPTY_TAG)[0]
+        self.validate()
 
     def validate(self) -> bool:
         """Validates the metadata for the audio track.
 
-        Any errors and warnings generated validation can be retrieved from their respective
-        properties.
+        This is run automatically when metadata is loaded. Any errors and warnings generated
+        by validation can be retrieved from their respective properties. Results are kept
+        until the track is refreshed or its type is changed, so calling this again with the
+        same track type returns the stored result. Results are also cached, so validating an
+        unchanged file with a track type it was already validated with does not repeat the
+        checks.
 
         Returns
         -------
         bool
             True if no validation errors were encountered, false otherwise
         """
-        valid_check = True
-
-        if "title" not in self.metadata:
-            if self.type.title_mandatory:
-                self.__errors.append(ValidationMessages.MISSING_TITLE.value)
-                valid_check = False
-            else:
-                self.__warnings.append(ValidationMessages().MISSING_TITLE.value)
-
-        if "album" not in self.metadata:
-            if self.type.album_mandatory:
-                self.__errors.append(ValidationMessages.MISSING_ALBUM.value)
-                valid_check = False
-            else:
-                self.__warnings.append(ValidationMessages.MISSING_ALBUM.value)
-
-        if "artist" not in self.metadata:
-            if self.type.artist_mandatory:
-                self.__errors.append(ValidationMessages.MISSING_ARTIST.value)
-                valid_check = False
-            else:
-                self.__warnings.append(ValidationMessages.MISSING_ARTIST.value)
-
-        if "date" not in self.metadata:
-            self.__warnings.append(ValidationMessages.MISSING_YEAR.value)
-
-        if not self.__validate_genre():
-            valid_check = False
-
-        self.__valid = valid_check
-        self.__validated = True
-        return self.__valid
+        if self.__validated_type == self.type:
+            return self.__valid
+
+        # reuse the existing lists, keeping their allocated capacity
+        self.__errors.clear()
+        self.__warnings.clear()
+        self.__validated_type = self.type
+
+        if self.metadata is NO_TAGS:
+            self.__errors.append(NO_METADATA)
+            self.__valid = False
+            return self.__valid
+
+        cache_key = (self.filename, self.type)
+        cached = _cached_validation(cache_key, self.metadata)
+        if cached is not None:
+            cached_errors, cached_warnings, self.__valid = cached
+            self.__errors.extend(cached_errors)
+            self.__warnings.extend(cached_warnings)
+            return self.__valid
+
+        # check the genre even if other tags are invalid, so that all errors are recorded
+        tags_valid = self.__validate_tags()
+        genre_valid = self.__validate_genre()
+        self.__valid = valid = tags_valid and genre_valid
+
+        result = (tuple(self.__errors), tuple(self.__warnings), valid)
+        _cache_validation(cache_key, self.metadata, result)
+        return valid
 
     def summary(self) -> str:
         """
         Returns a string representation of the validation results, for logging or UI display.
         """
-        summary = ""
-        summary += f"{self.filename}:\n"
-        if self.valid:
-            summary += "Valid\n"
-        else:
-            summary += "Invalid, "
+        summary = [f"{self.filename}:\n", "Valid\n" if self.valid else "Invalid, "]
 
-        if self.errors:
-            summary += "Errors:\n"
-            for error in self.errors:
-                summary += f"    - {error}\n"
+        errors = self.errors
+        if errors:
+            summary.append("Errors:\n")
+            summary.extend(f"    - {error}\n" for error in errors)
 
         if self.warnings:
-            summary += "Warnings:\n"
-            for warning in self.warnings:
-                summary += f"    - {warning}\n"
-
-        return summary
-
-    @property
-    def title(self) -> str:
-        """String representation of the title tag, if present. Read-only"""
-        if "title" in self.metadata:
-            return self.metadata["title"][0]
-        return ""
+            summary.append("Warnings:\n")
+            summary.extend(f"    - {warning}\n" for warning in self.warnings)
 
-    @property
-    def artist(self) -> str:
-        """String representation of the artist tag, if present. Read-only"""
-        if "artist" in self.metadata:
-            return self.metadata["artist"][0]
-        return ""
-
-    @property
-    def album(self) -> str:
-        """String representation of the album tag, if present. Read-only"""
-        if "album" in self.metadata:
-            return self.metadata["album"][0]
-        return ""
-
-    @property
-    def date(self) -> str:
-        """String representation of the date tag, if present. Read-only"""
-        if "date" in self.metadata:
-            return self.metadata["date"][0]
-        return ""
+        return "".join(summary)
 
     @property
     def error_count(self) -> int:
-        """Returns count of validation errors. If validation has not yet been performed, runs
-        validate() before returning. Read-only."""
-        return len(self.errors)
+        """Returns count of validation errors. Read-only."""
+        return len(self.__errors)
 
     @property
     def warning_count(self) -> int:
-        """
-        Returns count of validation warnings. If validation has not yet been performed, runs
-        validate() before returning. Read-only.
-        """
-        return len(self.warnings)
+        """Returns count of validation warnings. Read-only."""
+        return len(self.__warnings)
 
     @property
     def errors(self) -> List[str]:
-        """
-        Returns the list of validation errors. If validation has not yet been performed, runs
-        validate() before returning. Read-only.
-        """
-        if not self.__validated:
-            self.validate()
-        return self.__errors
+        """Returns the list of validation errors. Read-only."""
+        return [
+            error if isinstance(error, str) else f"{error[0]}: {error[1]}"
+            for error in self.__errors
+        ]
 
     @property
     def warnings(self) -> List[str]:
-        """
-        Returns the list of validation warnings. If validation has not yet been performed, runs
-        validate() before returning. Read-only.
-        """
-        if not self.__validated:
-            self.validate()
+        """Returns the list of validation warnings. Read-only."""
         return self.__warnings
 
     @property
     def valid(self) -> bool:
-        """
-        Returns the stored validation result for the audio track. If validation has not yet been
-        performed, runs validate() before returning. Read-only.
-        """
-        if not self.__validated:
-            self.validate()
+        """Returns the stored validation result for the audio track. Read-only."""
         return self.__valid
 
 
+def validate_tree(
+    root: str,
+    tracktype: TrackType = DEFAULT_TYPE,
+    onerror: Optional[Callable[[str, Exception], None]] = None,
+) -> Iterator[Track]:
+    """Validates the audio files in a directory and its subdirectories, one at a time as
+    they are found.
+
+    Parameters
+    ----------
+    root:
+        Directory to search for audio files
+    tracktype:
+        TrackType instance to use for validation
+    onerror: optional
+        Called with the file name and exception for each file that cannot be read. These
+        files are skipped, and the walk continues
+
+    Yields
+    ------
+    Track
+        A validated track for each readable file with an allowed extension
+    """
+    for filename in _iter_files(root):
+        if not filename.lower().endswith(ALLOWED_SUFFIXES):
+            continue
+        try:
+            track = Track(filename, tracktype)
+        except (OSError, mutagen.MutagenError) as error:
+            if onerror is not None:
+                onerror(filename, error)
+            continue
+        yield track
+
+
+def _validate_one(
+    filename: str, tracktype: TrackType
+) -> Tuple[List[str], List[str], bool]:
+    # report files that can't be read as invalid, rather than failing the whole batch
+    try:
+        track = Track(filename, tracktype)
+    except (OSError, mutagen.MutagenError) as error:
+        return [_read_error(error)], [], False
+    return track.errors, track.warnings, track.valid
+
+
+def validate_files(
+    filenames: Iterable[str], tracktype: TrackType = DEFAULT_TYPE
+) -> List[Tuple[List[str], List[str], bool]]:
+    """Validates a batch of audio files in parallel, using a pool of processes.
+
+    Intended for validating large numbers of files without the UI, e.g. when scanning a
+    library.
+
+    Parameters
+    ----------
+    filenames:
+        File names of audio tracks to validate
+    tracktype:
+        TrackType instance to use for validation
+
+    Returns
+    -------
+    List[Tuple[List[str], List[str], bool]]
+        Errors, warnings and validation result for each file, in the same order as
+        filenames. Files that cannot be read are invalid, with a READ_ERROR error
+    """
+    with ProcessPoolExecutor() as executor:
+        return list(
+            executor.map(
+                partial(_validate_one, tracktype=tracktype),
+                filenames,
+                chunksize=BATCH_CHUNK_SIZE,
+            )
+        )
+
+
+def _quick_valid(metadata: Dict[str, List[str]], tracktype: TrackType) -> bool:
+    """Checks whether metadata passes validation, stopping at the first error.
+
+    Mirrors the checks in Track.validate() that make a track invalid, without recording any
+    errors or warnings.
+    """
+    if tracktype.title_mandatory and "title" not in metadata:
+        return False
+    if tracktype.album_mandatory and "album" not in metadata:
+        return False
+    if tracktype.artist_mandatory and "artist" not in metadata:
+        return False
+    if "genre" not in metadata:
+        return False
+
+    valid_genre_items = tracktype.valid_genre_items
+    found_category = False
+    for item in _split_genres(metadata["genre"]):
+        if not found_category and _is_category(item):
+            found_category = True
+        elif item not in valid_genre_items:
+            return False
+    return found_category
+
+
+def _check_one(filename: str, tracktype: TrackType) -> bool:
+    try:
+        metadata = load_file_tags(filename)
+    except (OSError, mutagen.MutagenError):
+        return False
+    return _quick_valid(metadata, tracktype)
+
+
+def check_files(
+    filenames: Iterable[str], tracktype: TrackType = DEFAULT_TYPE
+) -> List[bool]:
+    """Checks whether a batch of audio files are valid, in parallel using a pool of
+    processes.
+
+    Faster than validate_files() when only the result is needed, as checking each file
+    stops at its first error, and no error or warning messages are built.
+
+    Parameters
+    ----------
+    filenames:
+        File names of audio tracks to check
+    tracktype:
+        TrackType instance to use for validation
+
+    Returns
+    -------
+    List[bool]
+        Whether each file is valid, in the same order as filenames. Files that cannot be
+        read are not valid
+    """
+    with ProcessPoolExecutor() as executor:
+        return list(
+            executor.map(
+                partial(_check_one, tracktype=tracktype),
+                filenames,
+                chunksize=BATCH_CHUNK_SIZE,
+            )
+        )
+
+
 class MainWindow(wx.Frame):
     """Main window for application."""
 
@@ -468,6 +761,7 @@ class MainWindow(wx.Frame):
         wx.Frame.__init__(self, parent, title=title, size=(640, 480))
 
         self.list = ObjectListView.ObjectListView(self, style=wx.LC_REPORT)
+        self.filename_index: Dict[str, Track] = {}
         self.list.SetColumns(
             [
                 ObjectListView.ColumnDefn(
@@ -540,15 +834,44 @@ class MainWindow(wx.Frame):
 
     def on_timer_up(self, event):
         """Process change in selection events, after end of one-shot timer."""
-        results_text = ""
-        for track in self.list.GetSelectedObjects():
-            results_text += track.summary()
-            results_text += "\n"
-        self.text_box.SetValue(results_text)
+        self.text_box.SetValue(
+            "\n".join(track.summary() for track in self.list.GetSelectedObjects())
+        )
+
+    def apply_parsed(
+        self, tracks: List[Track], failed: List[Tuple[str, Exception]]
+    ) -> None:
+        """Adds newly loaded tracks to the list, replacing any already present, and reports
+        any files that could not be loaded.
+
+        Must be called from the UI thread."""
+        # tracks already in the list are replaced with the newly loaded ones, which have the
+        # current type selection, so nothing is reloaded on the UI thread
+        replaced_tracks = []
+        for track in tracks:
+            existing_track = self.filename_index.get(track.filename)
+            if existing_track is not None:
+                replaced_tracks.append(existing_track)
+            self.filename_index[track.filename] = track
+
+        # update the list in one batch, rather than laying it out again for each track
+        self.list.Freeze()
+        try:
+            self.list.RemoveObjects(replaced_tracks)
+            self.list.AddObjects(tracks)
+        finally:
+            self.list.Thaw()
+
+        summaries = [track.summary() for track in tracks]
+        summaries.extend(
+            f"{filename}:\n{_read_error(error)}\n" for filename, error in failed
+        )
+        self.text_box.SetValue("\n".join(summaries))
 
     def on_clear(self, event):
         """Clear all currently loaded tracks."""
         self.list.DeleteAllItems()
+        self.filename_index.clear()
 
 
 class ValidationDropper(wx.FileDropTarget):
@@ -558,46 +881,49 @@ class ValidationDropper(wx.FileDropTarget):
         wx.FileDropTarget.__init__(self)
         self.window = window
 
-    def __import_file(self, insert_track_type: TrackType, filename: str) -> str:
-        results_text = ""
-        if filename.split(".")[-1].lower() in ALLOWED_EXTENSIONS:
-            # create track object
-            track = Track(filename, insert_track_type)
-
-            # check if track already exists in list
-            indices = [
-                i for i, s in enumerate(self.window.list.GetObjects()) if track == s
-            ]
-            if len(indices) > 0:  # if it does, reload metadata
-                existing_track = self.window.list.GetObjectAt(indices[0])
-
-                # update type to current selection
-                existing_track.type = insert_track_type
-
-                existing_track.refresh()
-                self.window.list.RefreshObject(existing_track)
-            else:  # if not, append to list
-                self.window.list.AddObject(track)
-            results_text = track.summary()
-            results_text += "\n"
-        return results_text
-
     def OnDropFiles(self, x, y, filenames):
-        """Receives dropped files, and runs validation on them."""
+        """Receives dropped files, and starts loading them for validation.
+
+        Files are loaded on a background thread, so the UI remains responsive while large
+        drops are processed."""
         insert_track_type = TRACK_TYPES[self.window.radio_box.GetSelection()]
-        results_text = ""
-        for i in filenames:
-            if path.isfile(i):
-                results_text += self.__import_file(insert_track_type, i)
-            elif path.isdir(i):
-                for root, dirs, files in walk(i):
-                    for name in files:
-                        results_text += self.__import_file(
-                            insert_track_type, path.join(root, name)
-                        )
-        self.window.text_box.SetValue(results_text)
+        Thread(
+            target=self.__parse_worker,
+            args=(self.window, filenames, insert_track_type),
+            daemon=True,
+        ).start()
         return True
 
+    @staticmethod
+    def __parse_worker(
+        window: MainWindow, filenames: List[str], insert_track_type: TrackType
+    ) -> None:
+        # filter on extension as files are found, and drop any file found more than once
+        paths = list(
+            dict.fromkeys(
+                i
+                for i in _iter_dropped(filenames)
+                if i.lower().endswith(ALLOWED_SUFFIXES)
+            )
+        )
+
+        # load tracks in parallel, as this is dominated by file I/O
+        tracks = []
+        failed = []
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                (filename, executor.submit(Track, filename, insert_track_type))
+                for filename in paths
+            ]
+            # keep loading the rest of the drop if any one file can't be read
+            for filename, future in futures:
+                try:
+                    tracks.append(future.result())
+                except (OSError, mutagen.MutagenError) as error:
+                    failed.append((filename, error))
+
+        wx.CallAfter(window.apply_parsed, tracks, failed)
+
 
 if __name__ == "__main__":
     app = wx.App()
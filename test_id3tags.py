@@ -0,0 +1,153 @@
+"""Tests for id3tags, comparing tags read directly from ID3v2 headers with EasyID3."""
+
+# pylint: disable=missing-function-docstring,protected-access
+
+
+import os
+import shutil
+import tempfile
+import unittest
+import zlib
+from unittest import mock
+
+import mutagen
+from mutagen.easyid3 import EasyID3
+
+import id3tags
+
+AUDIO_DATA = b"\xff\xfb\x90\x00" + b"\x00" * 400
+
+
+def _syncsafe(value: int) -> bytes:
+    return bytes((value >> shift) & 0x7F for shift in (21, 14, 7, 0))
+
+
+def _text(encoding: int, *values: str) -> bytes:
+    """Builds the body of a text frame, with values separated as ID3v2.4 does."""
+    codec, terminator = id3tags.ID3_TEXT_ENCODINGS[encoding]
+    return bytes([encoding]) + terminator.join(value.encode(codec) for value in values)
+
+
+def _frame(frame_id: bytes, body: bytes, version: int = 4, flags: int = 0) -> bytes:
+    size = _syncsafe(len(body)) if version == 4 else len(body).to_bytes(4, "big")
+    return frame_id + size + flags.to_bytes(2, "big") + body
+
+
+def _tag(
+    frames: bytes, version: int = 4, flags: int = 0, extended_header: bytes = b""
+) -> bytes:
+    data = extended_header + frames + b"\x00" * 32
+    return b"ID3" + bytes([version, 0, flags]) + _syncsafe(len(data)) + data
+
+
+class LoadTagsTest(unittest.TestCase):
+    """Tags loaded by id3tags should always match those loaded by mutagen's EasyID3."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        id3tags._load_tags.cache_clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, tag: bytes, trailer: bytes = b"") -> str:
+        filename = os.path.join(
+            self.directory, f"{len(os.listdir(self.directory))}.mp3"
+        )
+        with open(filename, "wb") as file_obj:
+            file_obj.write(tag + AUDIO_DATA + trailer)
+        return filename
+
+    def assert_matches_easyid3(self, filename: str, direct: bool) -> None:
+        """Checks loaded tags against EasyID3, and whether they were read directly."""
+        with open(filename, "rb") as file_obj:
+            self.assertEqual(id3tags._read_id3_subset(file_obj) is not None, direct)
+
+        easy = EasyID3(filename)
+        expected = {tag: easy[tag] for tag in id3tags.VALIDATED_TAGS if tag in easy}
+        self.assertEqual(id3tags.load_file_tags(filename), expected)
+
+    def test_encodings(self):
+        for version, encoding in ((3, 0), (3, 1), (4, 0), (4, 1), (4, 2), (4, 3)):
+            with self.subTest(version=version, encoding=encoding):
+                title = "Tïtle" if encoding == 0 else "Tïtle 中"
+                frames = _frame(b"TIT2", _text(encoding, title), version)
+                frames += _frame(b"TPE1", _text(encoding, "Ärtist"), version)
+                frames += _frame(b"TCON", _text(encoding, "cat21, CAN"), version)
+                self.assert_matches_easyid3(self.write(_tag(frames, version)), True)
+
+    def test_multiple_values(self):
+        for encoding in range(4):
+            with self.subTest(encoding=encoding):
+                frames = _frame(b"TPE1", _text(encoding, "A", "B", "C"))
+                frames += _frame(b"TCON", _text(encoding, "cat21", "CAN", "LOC"))
+                self.assert_matches_easyid3(self.write(_tag(frames)), True)
+
+    def test_dates_and_genres(self):
+        frames = _frame(b"TDRC", _text(3, "2020-05-01"))
+        frames += _frame(b"TCON", _text(3, "(17)", "cat31", "21"))
+        self.assert_matches_easyid3(self.write(_tag(frames)), True)
+
+    def test_extended_headers(self):
+        frames = _frame(b"TIT2", _text(0, "Title"), 3)
+        extended_header = (6).to_bytes(4, "big") + b"\x00" * 6
+        tag = _tag(frames, 3, 0x40, extended_header)
+        self.assert_matches_easyid3(self.write(tag), True)
+
+        frames = _frame(b"TIT2", _text(3, "Title"))
+        extended_header = _syncsafe(6) + b"\x01\x00"
+        tag = _tag(frames, 4, 0x40, extended_header)
+        self.assert_matches_easyid3(self.write(tag), True)
+
+    def test_repeated_frames(self):
+        frames = _frame(b"TCON", _text(3, "cat21")) + _frame(b"TCON", _text(3, "CAN"))
+        self.assert_matches_easyid3(self.write(_tag(frames)), False)
+
+        frames = _frame(b"TIT2", _text(3, "One")) + _frame(b"TIT2", _text(3, "Two"))
+        self.assert_matches_easyid3(self.write(_tag(frames)), False)
+
+    def test_fallback_triggers(self):
+        title = _frame(b"TIT2", _text(0, "Title"), 3)
+        compressed = b"\x00\x00\x00\x06" + zlib.compress(_text(0, "Title"))
+        cases = {
+            "ID3v2.2": _tag(b"TT2\x00\x00\x06\x00Title", 2),
+            "unsynchronised": _tag(title, 3, 0x80),
+            "compressed frame": _tag(_frame(b"TIT2", compressed, 3, 0x0080), 3),
+            "legacy date frames": _tag(title + _frame(b"TYER", _text(0, "1999"), 3), 3),
+            "invalid frame ID": _tag(title + _frame(b"ti t", _text(0, "x"), 3), 3),
+        }
+        for name, tag in cases.items():
+            with self.subTest(name):
+                self.assert_matches_easyid3(self.write(tag), False)
+
+    def test_id3v1_trailer(self):
+        trailer = (
+            b"TAG" + b"V1Title".ljust(30, b"\x00") + b"V1Artist".ljust(30, b"\x00")
+        )
+        trailer += b"\x00" * 30 + b"1990" + b"\x00" * 30 + b"\x11"
+        frames = _frame(b"TIT2", _text(3, "Title"))
+        self.assert_matches_easyid3(self.write(_tag(frames), trailer), False)
+
+    def test_extended_header_past_end_of_tag(self):
+        extended_header = (1000).to_bytes(4, "big") + b"\x00" * 6
+        filename = self.write(_tag(b"", 3, 0x40, extended_header))
+        with open(filename, "rb") as file_obj:
+            self.assertIsNone(id3tags._read_id3_subset(file_obj))
+        with self.assertRaises(mutagen.MutagenError):
+            EasyID3(filename)
+        with self.assertRaises(mutagen.MutagenError):
+            id3tags.load_file_tags(filename)
+
+    def test_no_tag(self):
+        filename = self.write(b"")
+        with mock.patch.object(
+            id3tags, "_load_id3_subset", wraps=id3tags._load_id3_subset
+        ) as load_id3_subset:
+            self.assertIs(id3tags.load_file_tags(filename), id3tags.NO_TAGS)
+            self.assertIs(id3tags.load_file_tags(filename), id3tags.NO_TAGS)
+        # files without a tag are cached, rather than parsed again
+        load_id3_subset.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()